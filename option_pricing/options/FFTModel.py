@@ -0,0 +1,140 @@
+# Standard library imports
+from enum import Enum
+
+# Third party imports
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+# Local package imports
+from .base import OptionPricingModel, OPTION_TYPE
+
+
+class CHARACTERISTIC_FUNCTION(Enum):
+    BLACK_SCHOLES = 'Black Scholes'
+    HESTON = 'Heston'
+
+
+class FFTModel(OptionPricingModel):
+    """
+    Class implementing calculation for European option price using Carr-Madan Fast Fourier Transform method.
+    Option prices are calculated from the characteristic function of the log of the underlying price at maturity,
+    for whole grid of strike prices at once in O(N log N):
+    - Fourier transform of damped call price is expressed via characteristic function
+    - Inverse transform is evaluated with FFT on an evenly spaced log-strike grid (Simpson's rule weights)
+    - Price for requested strike is interpolated from the grid
+    Supported dynamics are lognormal (Black-Scholes) and stochastic volatility (Heston).
+    """
+
+    def __init__(self, underlying_spot_price, strike_price, days_to_maturity, risk_free_rate, sigma,
+                 characteristic_function=CHARACTERISTIC_FUNCTION.BLACK_SCHOLES.value,
+                 kappa=2.0, theta=None, xi=0.3, rho=-0.7, v0=None,
+                 number_of_grid_points=4096, eta=0.25, alpha=1.5):
+        """
+        Initializes variables used in Carr-Madan FFT method.
+
+        underlying_spot_price: current stock or other underlying spot price
+        strike_price: strike price for option cotract
+        days_to_maturity: option contract maturity/exercise date
+        risk_free_rate: returns on risk-free assets (assumed to be constant until expiry date)
+        sigma: volatility of the underlying asset (standard deviation of asset's log returns)
+        characteristic_function: 'Black Scholes' or 'Heston'
+        kappa: Heston mean reversion speed of variance
+        theta: Heston long run variance (defaults to sigma^2)
+        xi: Heston volatility of variance
+        rho: Heston correlation between underlying and variance Brownian motions
+        v0: Heston initial variance (defaults to sigma^2)
+        number_of_grid_points: number of FFT points (power of 2)
+        eta: spacing of integration grid, log-strike grid spacing is 2*pi / (number_of_grid_points * eta)
+        alpha: damping factor of call price
+        """
+        self.S = underlying_spot_price
+        self.K = strike_price
+        self.T = days_to_maturity / 365
+        self.r = risk_free_rate
+        self.sigma = sigma
+        self.characteristic_function = characteristic_function
+
+        # Heston parameters
+        self.kappa = kappa
+        self.theta = sigma ** 2 if theta is None else theta
+        self.xi = xi
+        self.rho = rho
+        self.v0 = sigma ** 2 if v0 is None else v0
+
+        # Parameters for FFT
+        self.N = number_of_grid_points
+        self.eta = eta
+        self.alpha = alpha
+
+        self.strike_grid = None
+        self.call_prices_grid = None
+
+    def _characteristic_function(self, u):
+        """Characteristic function of log of the underlying price at maturity under risk neutral measure."""
+        if self.characteristic_function == CHARACTERISTIC_FUNCTION.BLACK_SCHOLES.value:
+            return np.exp(1j * u * (np.log(self.S) + (self.r - 0.5 * self.sigma ** 2) * self.T)
+                          - 0.5 * self.sigma ** 2 * u ** 2 * self.T)
+        elif self.characteristic_function == CHARACTERISTIC_FUNCTION.HESTON.value:
+            # Formulation avoiding discontinuities of complex logarithm (Albrecher et al.)
+            beta = self.kappa - self.rho * self.xi * 1j * u
+            d = np.sqrt(beta ** 2 + self.xi ** 2 * (1j * u + u ** 2))
+            g = (beta - d) / (beta + d)
+            exp_dT = np.exp(-d * self.T)
+            C = (1j * u * self.r * self.T
+                 + self.kappa * self.theta / self.xi ** 2 * ((beta - d) * self.T - 2 * np.log((1 - g * exp_dT) / (1 - g))))
+            D = (beta - d) / self.xi ** 2 * (1 - exp_dT) / (1 - g * exp_dT)
+            return np.exp(C + D * self.v0 + 1j * u * np.log(self.S))
+        else:
+            raise ValueError(f'Unsupported characteristic function: {self.characteristic_function}')
+
+    def calculate_strike_grid_prices(self):
+        """
+        Calculates call option prices for whole strike grid with single FFT.
+        Grid is centered around the spot price and saved together with prices.
+        """
+        # Integration grid and log-strike grid (centered around log spot)
+        v = self.eta * np.arange(self.N)
+        lambda_ = 2 * np.pi / (self.N * self.eta)
+        b = 0.5 * self.N * lambda_ - np.log(self.S)
+        k = -b + lambda_ * np.arange(self.N)
+
+        # Fourier transform of damped call price
+        psi = (np.exp(-self.r * self.T) * self._characteristic_function(v - (self.alpha + 1) * 1j)
+               / (self.alpha ** 2 + self.alpha - v ** 2 + 1j * (2 * self.alpha + 1) * v))
+
+        # Simpson's rule weights
+        weights = self.eta / 3 * (3 + (-1) ** (np.arange(self.N) + 1))
+        weights[0] = self.eta / 3
+
+        x = np.exp(1j * b * v) * psi * weights
+        self.strike_grid = np.exp(k)
+        self.call_prices_grid = np.exp(-self.alpha * k) / np.pi * np.real(np.fft.fft(x))
+
+    def calculate_option_prices(self, strike_prices, option_type):
+        """
+        Calculates call/put option prices for array of strike prices by interpolating FFT strike grid.
+        Put prices are calculated from call prices using put-call parity.
+
+        strike_prices: array of strike prices
+        option_type: 'Call Option' or 'Put Option'
+        """
+        if self.call_prices_grid is None:
+            self.calculate_strike_grid_prices()
+        strike_prices = np.asarray(strike_prices, dtype=float)
+        log_strikes = np.log(self.strike_grid)
+        call_prices = CubicSpline(log_strikes, self.call_prices_grid)(np.log(strike_prices))
+
+        if option_type == OPTION_TYPE.CALL_OPTION.value:
+            return call_prices
+        elif option_type == OPTION_TYPE.PUT_OPTION.value:
+            return call_prices - self.S + strike_prices * np.exp(-self.r * self.T)
+        else:
+            return -1
+
+    def _calculate_call_option_price(self):
+        """Calculates price for call option by interpolating FFT strike grid at the contract strike price."""
+        return float(self.calculate_option_prices(self.K, OPTION_TYPE.CALL_OPTION.value))
+
+    def _calculate_put_option_price(self):
+        """Calculates price for put option from call price using put-call parity."""
+        return float(self.calculate_option_prices(self.K, OPTION_TYPE.PUT_OPTION.value))
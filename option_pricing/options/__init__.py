@@ -1,4 +1,7 @@
 from .BlackScholesModel import BlackScholesModel
 from .MonteCarloSimulation import MonteCarloPricing
 from .BinomialTreeModel import BinomialTreeModel
+from .FFTModel import FFTModel
 from .ticker import Ticker
+from .repricing import RepricingEngine, TickStream, Tick
+from .backtest import Backtester, Strategy, OptionLeg
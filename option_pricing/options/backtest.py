@@ -0,0 +1,266 @@
+# Standard library imports
+from collections import namedtuple
+
+# Third party imports
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+
+# Local package imports
+from .base import OPTION_TYPE
+
+
+OptionLeg = namedtuple('OptionLeg', ['option_type', 'quantity', 'moneyness', 'days_to_maturity'])
+
+
+class Strategy:
+    """
+    Class describing option strategy as a set of option legs and position in the underlying.
+    Every leg is opened at strike = moneyness * spot price and rolled into new contract
+    roll_days_before_expiry calendar days before its expiry (0 means holding until expiry).
+    """
+
+    def __init__(self, name, legs, underlying_quantity=0, roll_days_before_expiry=0):
+        """
+        name: name of the strategy
+        legs: list of OptionLeg tuples (option_type, quantity, moneyness, days_to_maturity), negative quantity for short leg
+        underlying_quantity: number of units of underlying held
+        roll_days_before_expiry: number of calendar days before expiry when leg is rolled into new contract
+        """
+        self.name = name
+        self.legs = legs
+        self.underlying_quantity = underlying_quantity
+        self.roll_days_before_expiry = roll_days_before_expiry
+
+    @staticmethod
+    def covered_call(moneyness=1.05, days_to_maturity=30):
+        """Long underlying and short out of the money call."""
+        return Strategy('Covered Call', [OptionLeg(OPTION_TYPE.CALL_OPTION.value, -1, moneyness, days_to_maturity)],
+                        underlying_quantity=1)
+
+    @staticmethod
+    def straddle(days_to_maturity=30):
+        """Long at the money call and long at the money put."""
+        return Strategy('Straddle', [OptionLeg(OPTION_TYPE.CALL_OPTION.value, 1, 1.0, days_to_maturity),
+                                     OptionLeg(OPTION_TYPE.PUT_OPTION.value, 1, 1.0, days_to_maturity)])
+
+    @staticmethod
+    def rolling_put(moneyness=0.95, days_to_maturity=90, roll_days_before_expiry=30):
+        """Long out of the money put rolled before expiry."""
+        return Strategy('Rolling Put', [OptionLeg(OPTION_TYPE.PUT_OPTION.value, 1, moneyness, days_to_maturity)],
+                        roll_days_before_expiry=roll_days_before_expiry)
+
+
+class Backtester:
+    """
+    Class for backtesting option strategies on historical data with Black-Scholes marks.
+
+    All legs are priced across all dates and tickers in batched array operations:
+    - Volatility is estimated per ticker as annualized rolling realized volatility of log returns.
+    - Roll schedule of each leg is calculated once per ticker, starting on the ticker's first date with volatility estimate.
+    - Contracts are marked daily with current spot and volatility.
+    - Contracts held to expiry are settled at intrinsic value on the last trading date on or before expiry.
+    Daily P&L of a position is the change of its mark from ticker's previous trading date (P&L on roll dates is
+    realized on the old contract). Dates without price for a ticker (different histories, holidays) have zero P&L
+    and missing (NaN) marks and Greeks.
+    """
+
+    def __init__(self, prices, risk_free_rate, volatility_window=21):
+        """
+        prices: dataframe of underlying prices with dates as index and tickers as columns (NaN where ticker has no price)
+        risk_free_rate: returns on risk-free assets (assumed to be constant)
+        volatility_window: number of trading days used for realized volatility estimate
+        """
+        self.prices = prices.dropna(how='all')
+        self.r = risk_free_rate
+        self.volatility_window = volatility_window
+        self.volatility = Backtester.realized_volatility(self.prices, volatility_window)
+
+    @staticmethod
+    def from_historical_data(data, risk_free_rate, column_name='Close', volatility_window=21):
+        """
+        Creates backtester from data fetched with Ticker.get_historical_data.
+
+        Params:
+        data: dictionary with ticker as key and fetched dataframe as value
+        risk_free_rate: returns on risk-free assets (assumed to be constant)
+        column_name: name of the price column in dataframes
+        volatility_window: number of trading days used for realized volatility estimate
+        """
+        columns = {}
+        for ticker, df in data.items():
+            if df is None:
+                continue
+            column = df[column_name]
+            # yfinance may return MultiIndex columns (price, ticker)
+            if isinstance(column, pd.DataFrame):
+                column = column.iloc[:, 0]
+            columns[ticker] = column
+        return Backtester(pd.DataFrame(columns), risk_free_rate, volatility_window)
+
+    @staticmethod
+    def realized_volatility(prices, window=21):
+        """
+        Calculates annualized rolling realized volatility (standard deviation of daily log returns).
+        Returns are calculated for each ticker between its own consecutive prices, so gaps in data do not reset the window.
+
+        Params:
+        prices: dataframe of underlying prices
+        window: number of trading days in rolling window
+        """
+        volatility = {column: np.log(prices[column].dropna()).diff().rolling(window).std() * np.sqrt(252)
+                      for column in prices.columns}
+        return pd.DataFrame(volatility, columns=prices.columns).reindex(prices.index)
+
+    def _black_scholes(self, S, K, T, sigma, is_call):
+        """
+        Calculates Black-Scholes price, delta, gamma, vega and theta (per calendar day) for arrays of contracts.
+        Contracts with non-positive time to maturity are valued at intrinsic value.
+        """
+        expired = T <= 0
+        T = np.where(expired, 1.0, T)
+        sqrt_T = np.sqrt(T)
+        d1 = (np.log(S / K) + (self.r + 0.5 * sigma ** 2) * T) / (sigma * sqrt_T)
+        d2 = d1 - sigma * sqrt_T
+        discounted_K = K * np.exp(-self.r * T)
+
+        if is_call:
+            price = S * norm.cdf(d1) - discounted_K * norm.cdf(d2)
+            delta = norm.cdf(d1)
+            theta = -S * norm.pdf(d1) * sigma / (2 * sqrt_T) - self.r * discounted_K * norm.cdf(d2)
+            intrinsic = np.maximum(S - K, 0.0)
+            expired_delta = (S > K).astype(float)
+        else:
+            price = discounted_K * norm.cdf(-d2) - S * norm.cdf(-d1)
+            delta = norm.cdf(d1) - 1.0
+            theta = -S * norm.pdf(d1) * sigma / (2 * sqrt_T) + self.r * discounted_K * norm.cdf(-d2)
+            intrinsic = np.maximum(K - S, 0.0)
+            expired_delta = -(S < K).astype(float)
+        gamma = norm.pdf(d1) / (S * sigma * sqrt_T)
+        vega = S * norm.pdf(d1) * sqrt_T
+
+        return (np.where(expired, intrinsic, price),
+                np.where(expired, expired_delta, delta),
+                np.where(expired, 0.0, gamma),
+                np.where(expired, 0.0, vega),
+                np.where(expired, 0.0, theta / 365))
+
+    def _roll_schedule(self, leg, roll_days_before_expiry, ticker_index):
+        """
+        Returns opening and closing date indices of consecutive contracts of the leg for single ticker,
+        starting on the ticker's first date with volatility estimate.
+        Contract is closed on the last trading date on or before its roll date and the next one is opened on the same date.
+        Contract still open at the end of data has closing index equal to number of dates.
+        """
+        dates = self.prices.index.values
+        valid = np.flatnonzero(self.volatility.iloc[:, ticker_index].notna().values)
+        valid_dates = dates[valid]
+        holding_period = np.timedelta64(max(leg.days_to_maturity - roll_days_before_expiry, 1), 'D')
+        opens, closes = [], []
+        k = 0
+        while k < len(valid):
+            opens.append(valid[k])
+            roll_date = valid_dates[k] + holding_period
+            if roll_date > valid_dates[-1]:
+                closes.append(len(dates))
+                break
+            close = np.searchsorted(valid_dates, roll_date, side='right') - 1
+            # No trading date between opening and roll date, roll on the next trading date
+            k = max(close, k + 1)
+            closes.append(valid[k])
+        return np.array(opens, dtype=int), np.array(closes, dtype=int)
+
+    def _backtest_leg(self, leg, roll_days_before_expiry):
+        """Calculates daily P&L, marks and Greeks (dates x tickers arrays) of single option leg."""
+        S = self.prices.values
+        sigma = self.volatility.values
+        dates = self.prices.index.values
+        n, m = S.shape
+        is_call = leg.option_type == OPTION_TYPE.CALL_OPTION.value
+
+        # Opening and closing date index of contract held at the end of each date for each ticker
+        held_open = np.full((n, m), -1)
+        held_close = np.full((n, m), n)
+        for j in range(m):
+            opens, closes = self._roll_schedule(leg, roll_days_before_expiry, j)
+            if len(opens) == 0:
+                continue
+            k = np.searchsorted(opens, np.arange(n), side='right') - 1
+            held = k >= 0
+            held_open[held, j] = opens[k[held]]
+            held_close[held, j] = closes[k[held]]
+
+        def mark(t, j, o, c):
+            """Marks contracts of tickers j opened on date indices o and closed on c at date indices t."""
+            K = leg.moneyness * S[o, j]
+            T = (dates[o] + np.timedelta64(leg.days_to_maturity, 'D') - dates[t]) / np.timedelta64(1, 'D') / 365
+            if roll_days_before_expiry == 0:
+                # Contract held to expiry is settled on its closing date (last trading date on or before expiry)
+                T = np.where(t >= c, 0.0, T)
+            return self._black_scholes(S[t, j], K, T, sigma[t, j], is_call)
+
+        has_price = ~np.isnan(S)
+        pnl = np.zeros((n, m))
+        value = np.full((n, m), np.nan)
+        greeks = {name: np.where(has_price, 0.0, np.nan) for name in ('value', 'delta', 'gamma', 'vega', 'theta')}
+
+        # Marks of contracts held at the end of the day
+        t, j = np.nonzero(has_price & (held_open >= 0))
+        marks = mark(t, j, held_open[t, j], held_close[t, j])
+        value[t, j] = marks[0]
+        for name, greek in zip(greeks, marks):
+            greeks[name][t, j] = leg.quantity * greek
+
+        # Marks of contracts held from ticker's previous trading date (differ from above only on roll dates)
+        previous = self._previous_trading_date(has_price)
+        t, j = np.nonzero(has_price & (previous >= 0))
+        p = previous[t, j]
+        carried = held_open[p, j] >= 0
+        t, j, p = t[carried], j[carried], p[carried]
+        previous_value = mark(t, j, held_open[p, j], held_close[p, j])[0]
+        pnl[t, j] = leg.quantity * (previous_value - value[p, j])
+
+        return pnl, greeks
+
+    @staticmethod
+    def _previous_trading_date(has_price):
+        """Returns index of ticker's previous date with price for each date (-1 if there is none)."""
+        indices = np.where(has_price, np.arange(len(has_price))[:, None], -1)
+        previous = np.full(has_price.shape, -1)
+        previous[1:] = np.maximum.accumulate(indices, axis=0)[:-1]
+        return previous
+
+    def run(self, strategy):
+        """
+        Backtests strategy on all tickers and returns dictionary of dataframes (dates x tickers):
+        pnl, cumulative_pnl, value (mark of option legs), delta, gamma, vega and theta (per calendar day).
+
+        Params:
+        strategy: Strategy instance
+        """
+        S = self.prices.values
+        has_price = ~np.isnan(S)
+        # Underlying position is held from ticker's first date with volatility estimate
+        start = np.where(self.volatility.notna().values.any(axis=0),
+                         self.volatility.notna().values.argmax(axis=0), len(S))
+        holding = np.arange(len(S))[:, None] >= start
+
+        previous = self._previous_trading_date(has_price)
+        carried = has_price & (previous >= start)
+        pnl = np.zeros(S.shape)
+        t, j = np.nonzero(carried)
+        pnl[t, j] = strategy.underlying_quantity * (S[t, j] - S[previous[t, j], j])
+
+        totals = {name: np.where(has_price, 0.0, np.nan) for name in ('value', 'delta', 'gamma', 'vega', 'theta')}
+        totals['delta'][has_price & holding] = strategy.underlying_quantity
+
+        for leg in strategy.legs:
+            leg_pnl, leg_greeks = self._backtest_leg(leg, strategy.roll_days_before_expiry)
+            pnl += leg_pnl
+            for name in totals:
+                totals[name] += leg_greeks[name]
+
+        results = {'pnl': pnl, 'cumulative_pnl': np.cumsum(pnl, axis=0)}
+        results.update(totals)
+        return {name: pd.DataFrame(values, index=self.prices.index, columns=self.prices.columns)
+                for name, values in results.items()}
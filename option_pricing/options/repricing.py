@@ -0,0 +1,223 @@
+# Standard library imports
+import csv
+import time
+from collections import namedtuple
+
+# Third party imports
+import numpy as np
+from scipy.stats import norm
+
+# Local package imports
+from .base import OPTION_TYPE
+
+
+Tick = namedtuple('Tick', ['timestamp', 'symbol', 'spot'])
+
+
+class TickStream:
+    """Class for replaying recorded spot ticks from a local file."""
+
+    @staticmethod
+    def from_csv(path):
+        """
+        Yields ticks stored in csv file, one tick per row in timestamp,symbol,spot format.
+        Header row is optional and skipped if present.
+
+        Params:
+        path: path to the csv file with recorded ticks
+        """
+        with open(path, newline='') as f:
+            for row in csv.reader(f):
+                if not row or row[0].strip().lower() == 'timestamp':
+                    continue
+                yield Tick(row[0].strip(), row[1].strip(), float(row[2]))
+
+    @staticmethod
+    def to_csv(path, ticks):
+        """
+        Records ticks into csv file so they can be replayed later with from_csv.
+
+        Params:
+        path: path to the csv file
+        ticks: iterable of Tick tuples
+        """
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(Tick._fields)
+            for tick in ticks:
+                writer.writerow(tick)
+
+
+class RepricingEngine:
+    """
+    Class keeping live Black-Scholes marks for an option chain as spot ticks arrive.
+
+    Time invariant intermediates of every contract (sqrt(T), discounted strike, drift term) are cached once,
+    so that each tick only touches contracts written on the ticked underlying:
+    - Contracts whose spot moved less than the threshold since their last full reprice are updated
+      with delta/gamma Taylor expansion around that anchor.
+    - Contracts whose spot moved more, or whose inputs were changed (volatility), are fully repriced.
+    Time to maturity is kept constant while the engine runs (intraday marking).
+    """
+
+    def __init__(self, contracts, risk_free_rate, full_reprice_threshold=0.01):
+        """
+        Initializes the chain and cached per-contract intermediates.
+
+        contracts: iterable of (symbol, strike_price, days_to_maturity, sigma, option_type) tuples,
+                   option_type being 'Call Option' or 'Put Option'
+        risk_free_rate: returns on risk-free assets (assumed to be constant until expiry date)
+        full_reprice_threshold: relative spot move since last full reprice above which contract is fully repriced
+        """
+        contracts = list(contracts)
+        self.symbols = np.array([c[0] for c in contracts])
+        self.K = np.array([c[1] for c in contracts], dtype=float)
+        self.T = np.array([c[2] for c in contracts], dtype=float) / 365
+        self.sigma = np.array([c[3] for c in contracts], dtype=float)
+        self.is_call = np.array([c[4] == OPTION_TYPE.CALL_OPTION.value for c in contracts])
+        self.r = risk_free_rate
+        self.full_reprice_threshold = full_reprice_threshold
+
+        # Contract indices per underlying, so a tick only touches its own contracts
+        self._symbol_index = {symbol: np.flatnonzero(self.symbols == symbol) for symbol in np.unique(self.symbols)}
+        self.spots = {}
+
+        n = len(contracts)
+        self._sigma_sqrt_T = np.empty(n)
+        self._drift = np.empty(n)
+        self._discounted_K = np.empty(n)
+        self._cache_intermediates(np.arange(n))
+
+        # Marks and Greeks at the anchor spot (spot of the last full reprice)
+        self.prices = np.full(n, np.nan)
+        self.deltas = np.full(n, np.nan)
+        self._anchor_S = np.full(n, np.nan)
+        self._anchor_price = np.full(n, np.nan)
+        self._anchor_delta = np.full(n, np.nan)
+        self._anchor_gamma = np.full(n, np.nan)
+        self._dirty = np.ones(n, dtype=bool)
+
+        self.reset_statistics()
+
+    def _cache_intermediates(self, idx):
+        """Caches intermediates that do not depend on spot price for specified contracts."""
+        self._sigma_sqrt_T[idx] = self.sigma[idx] * np.sqrt(self.T[idx])
+        self._drift[idx] = (self.r + 0.5 * self.sigma[idx] ** 2) * self.T[idx]
+        self._discounted_K[idx] = self.K[idx] * np.exp(-self.r * self.T[idx])
+
+    def _full_reprice(self, idx, S):
+        """Reprices specified contracts with Black-Scholes formula and resets their anchor to spot S."""
+        sigma_sqrt_T = self._sigma_sqrt_T[idx]
+        d1 = (np.log(S / self.K[idx]) + self._drift[idx]) / sigma_sqrt_T
+        d2 = d1 - sigma_sqrt_T
+        is_call = self.is_call[idx]
+
+        call = S * norm.cdf(d1) - self._discounted_K[idx] * norm.cdf(d2)
+        # Put-call parity: P = C - S + PV(K)
+        price = np.where(is_call, call, call - S + self._discounted_K[idx])
+        delta = np.where(is_call, norm.cdf(d1), norm.cdf(d1) - 1.0)
+        gamma = norm.pdf(d1) / (S * sigma_sqrt_T)
+
+        self.prices[idx] = price
+        self.deltas[idx] = delta
+        self._anchor_S[idx] = S
+        self._anchor_price[idx] = price
+        self._anchor_delta[idx] = delta
+        self._anchor_gamma[idx] = gamma
+        self._dirty[idx] = False
+        self.full_reprices += len(idx)
+
+    def _fast_update(self, idx, S):
+        """Updates specified contracts with second order Taylor expansion around their anchor spot."""
+        dS = S - self._anchor_S[idx]
+        self.prices[idx] = self._anchor_price[idx] + self._anchor_delta[idx] * dS + 0.5 * self._anchor_gamma[idx] * dS ** 2
+        self.deltas[idx] = self._anchor_delta[idx] + self._anchor_gamma[idx] * dS
+        self.fast_updates += len(idx)
+
+    def _reprice(self, idx, S):
+        """Reprices specified contracts of single underlying, choosing between full reprice and fast update."""
+        move = np.abs(S / self._anchor_S[idx] - 1.0)
+        full = self._dirty[idx] | ~(move <= self.full_reprice_threshold)
+        if full.any():
+            self._full_reprice(idx[full], S)
+        if not full.all():
+            self._fast_update(idx[~full], S)
+
+    def on_tick(self, tick):
+        """
+        Consumes single spot tick and updates marks of contracts written on ticked underlying.
+        Returns indices of updated contracts.
+
+        Params:
+        tick: Tick tuple (timestamp, symbol, spot)
+        """
+        idx = self._symbol_index.get(tick.symbol)
+        self.ticks_processed += 1
+        if idx is None:
+            return np.empty(0, dtype=int)
+        if self.spots.get(tick.symbol) == tick.spot:
+            # Inputs did not change, only contracts with changed parameters need repricing
+            idx = idx[self._dirty[idx]]
+            if len(idx) == 0:
+                return idx
+        self.spots[tick.symbol] = tick.spot
+        self._reprice(idx, tick.spot)
+        return idx
+
+    def set_volatility(self, contract_index, sigma):
+        """
+        Changes volatility of specified contracts and marks them for full reprice on next tick or flush.
+
+        Params:
+        contract_index: index (or array of indices) of contracts in the chain
+        sigma: new volatility of the underlying asset
+        """
+        idx = np.atleast_1d(contract_index)
+        self.sigma[idx] = sigma
+        self._cache_intermediates(idx)
+        self._dirty[idx] = True
+
+    def flush(self):
+        """Fully reprices all contracts marked dirty whose underlying spot is already known."""
+        for symbol, S in self.spots.items():
+            idx = self._symbol_index[symbol]
+            idx = idx[self._dirty[idx]]
+            if len(idx) > 0:
+                self._full_reprice(idx, S)
+
+    def run(self, ticks):
+        """
+        Consumes tick stream (e.g. TickStream.from_csv) and returns performance statistics.
+        Tick-to-mark latency is measured from receiving the tick from the stream until marks are updated,
+        time spent waiting for the next tick is not included.
+
+        Params:
+        ticks: iterable of Tick tuples
+        """
+        for tick in ticks:
+            start = time.perf_counter()
+            self.on_tick(tick)
+            self._latencies.append(time.perf_counter() - start)
+        return self.get_statistics()
+
+    def reset_statistics(self):
+        """Resets counters used for performance statistics."""
+        self.ticks_processed = 0
+        self.full_reprices = 0
+        self.fast_updates = 0
+        self._latencies = []
+
+    def get_statistics(self):
+        """Returns dictionary with update counters, updates per second and tick-to-mark latency (microseconds)."""
+        latencies = np.array(self._latencies) * 1e6
+        elapsed = latencies.sum() / 1e6
+        updates = self.full_reprices + self.fast_updates
+        return {
+            'ticks': self.ticks_processed,
+            'full_reprices': self.full_reprices,
+            'fast_updates': self.fast_updates,
+            'updates_per_second': updates / elapsed if elapsed > 0 else None,
+            'latency_mean_us': latencies.mean() if len(latencies) else None,
+            'latency_p50_us': np.percentile(latencies, 50) if len(latencies) else None,
+            'latency_p99_us': np.percentile(latencies, 99) if len(latencies) else None,
+        }
@@ -5,9 +5,16 @@ Script testing functionalities of option_pricing package:
 - Testing Black-Scholes option pricing model   
 - Testing Binomial option pricing model   
 - Testing Monte Carlo Simulation for option pricing   
+- Testing FFT (Carr-Madan) option pricing model for Black-Scholes and Heston dynamics
+- Testing tick-driven incremental repricing engine
+- Testing vectorized backtesting of option strategies on historical data
 """
 
-from option_pricing import BlackScholesModel, MonteCarloPricing, BinomialTreeModel, Ticker
+# Standard library imports
+import os
+import tempfile
+
+from option_pricing import BlackScholesModel, MonteCarloPricing, BinomialTreeModel, FFTModel, Ticker, RepricingEngine, TickStream, Backtester, Strategy
 
 # Fetching the prices from yahoo finance
 data = Ticker.get_historical_data('TSLA')
@@ -31,3 +38,46 @@ MC.simulate_prices()
 print(MC.calculate_option_price('Call Option'))
 print(MC.calculate_option_price('Put Option'))
 MC.plot_simulation_results(20)
+
+# FFT model testing (lognormal case compared with Black-Scholes, then Heston dynamics)
+FFT = FFTModel(100, 100, 365, 0.1, 0.2)
+print(FFT.calculate_option_price('Call Option'), BSM.calculate_option_price('Call Option'))
+print(FFT.calculate_option_price('Put Option'), BSM.calculate_option_price('Put Option'))
+for days in (7, 30, 365, 1825):
+    FFT_grid = FFTModel(100, 100, days, 0.1, 0.2)
+    strikes = list(range(50, 201, 10))
+    for option_type in ('Call Option', 'Put Option'):
+        for strike, price in zip(strikes, FFT_grid.calculate_option_prices(strikes, option_type)):
+            assert abs(price - BlackScholesModel(100, strike, days, 0.1, 0.2).calculate_option_price(option_type)) < 1e-5
+FFT_Heston = FFTModel(100, 100, 365, 0.1, 0.2, 'Heston', kappa=1.5, theta=0.04, xi=0.5, rho=-0.7, v0=0.04)
+print(FFT_Heston.calculate_option_prices([80, 90, 100, 110, 120], 'Call Option'))
+
+# Incremental repricing engine testing (replaying recorded spot ticks)
+chain = [('TSLA', strike, 30, 0.2, option_type) for strike in range(80, 121, 5) for option_type in ('Call Option', 'Put Option')]
+engine = RepricingEngine(chain, 0.1, full_reprice_threshold=0.01)
+ticks_file = tempfile.NamedTemporaryFile(suffix='.csv', delete=False)
+ticks_file.close()
+TickStream.to_csv(ticks_file.name, [('2024-01-01T09:30:00', 'TSLA', 100.0), ('2024-01-01T09:30:01', 'TSLA', 100.2),
+                                    ('2024-01-01T09:30:02', 'TSLA', 102.5), ('2024-01-01T09:30:03', 'TSLA', 102.6)])
+print(engine.run(TickStream.from_csv(ticks_file.name)))
+os.remove(ticks_file.name)
+print(engine.prices)
+# Large move is fully repriced, small moves use delta/gamma update close to Black-Scholes price
+assert engine.full_reprices == 2 * len(chain) and engine.fast_updates == 2 * len(chain)
+for price, (_, strike, days, sigma, option_type) in zip(engine.prices, chain):
+    assert abs(price - BlackScholesModel(102.6, strike, days, 0.1, sigma).calculate_option_price(option_type)) < 1e-3
+
+# Backtesting option strategies on fetched historical data
+backtester = Backtester.from_historical_data({'TSLA': data}, 0.1)
+for strategy in (Strategy.covered_call(), Strategy.straddle(), Strategy.rolling_put()):
+    results = backtester.run(strategy)
+    print(strategy.name, results['cumulative_pnl'].iloc[-1].values, results['delta'].iloc[-1].values)
+    assert not results['pnl'].isna().values.any()
+
+# Staggered ticker histories keep all dates, the short history is backtested as if it were alone
+staggered = Backtester.from_historical_data({'TSLA': data, 'TSLA_SHORT': data.iloc[-100:]}, 0.1)
+alone = Backtester.from_historical_data({'TSLA_SHORT': data.iloc[-100:]}, 0.1)
+assert len(staggered.prices) == len(data)
+for strategy in (Strategy.covered_call(), Strategy.straddle(), Strategy.rolling_put()):
+    short_pnl = staggered.run(strategy)['cumulative_pnl']['TSLA_SHORT'].iloc[-1]
+    assert abs(short_pnl - alone.run(strategy)['cumulative_pnl']['TSLA_SHORT'].iloc[-1]) < 1e-8